@@ -22,9 +22,12 @@ from pathlib import Path
 import re
 import subprocess
 import sys
-import tempfile
 import time
 
+# Markdown code-block and accessibility patterns, compiled once
+_PYTHON_BLOCK_RE = re.compile(r"```python\n(.*?)\n```", re.DOTALL)
+_IMG_TAG_RE = re.compile(r"<img[^>]*>", re.IGNORECASE)
+
 
 # Colors for output
 class Colors:
@@ -172,7 +175,7 @@ def test_readme_examples(verbose: bool = False) -> tuple[int, int]:
         return 1, 1
 
     # Extract Python code blocks
-    code_blocks = re.findall(r"```python\n(.*?)\n```", content, re.DOTALL)
+    code_blocks = _PYTHON_BLOCK_RE.findall(content)
 
     print_status(f"Found {len(code_blocks)} Python code blocks", "INFO")
 
@@ -193,20 +196,19 @@ def test_readme_examples(verbose: bool = False) -> tuple[int, int]:
 
         print_status(f"Testing code block {i + 1}...", "INFO")
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            # Add necessary setup
-            f.write("import sys\n")
-            f.write('sys.path.insert(0, ".")\n')
-            f.write("import warnings\n")
-            f.write('warnings.filterwarnings("ignore", category=DeprecationWarning)\n')
-            f.write(code)
-            temp_file = f.name
+        # Add necessary setup and run the block inline, with no temp file
+        script = (
+            "import sys\n"
+            'sys.path.insert(0, ".")\n'
+            "import warnings\n"
+            'warnings.filterwarnings("ignore", category=DeprecationWarning)\n'
+            f"{code}"
+        )
 
         try:
             # Run the code
             result = subprocess.run(
-                [sys.executable, temp_file],
+                [sys.executable, "-c", script],
                 capture_output=True,
                 text=True,
                 timeout=30,
@@ -230,8 +232,6 @@ def test_readme_examples(verbose: bool = False) -> tuple[int, int]:
         except Exception as e:
             print_status(f"  Code block {i + 1}", "FAIL", f"Error: {e}")
             total_failures += 1
-        finally:
-            os.unlink(temp_file)
 
     return total_failures, total_tests
 
@@ -334,9 +334,11 @@ def check_documentation_coverage(verbose: bool = False) -> dict[str, int]:
                     documented = total - undocumented_count
                     undocumented = undocumented_count
             else:
-                # Fallback to old method
-                documented = len(re.findall(r"documented", content, re.IGNORECASE))
-                undocumented = len(re.findall(r"undocumented", content, re.IGNORECASE))
+                # Fallback to old method: count literal occurrences without
+                # building match lists
+                lowered = content.lower()
+                documented = lowered.count("documented")
+                undocumented = lowered.count("undocumented")
                 total = documented + undocumented
 
             coverage_stats.update(
@@ -421,14 +423,15 @@ def check_accessibility(verbose: bool = False) -> tuple[int, int]:
     for html_file in html_files:
         try:
             content = html_file.read_text()
-            # Find img tags without alt attributes
-            img_pattern = r"<img[^>]*src=[^>]*>"
-            alt_pattern = r"<img[^>]*alt=[^>]*>"
 
-            img_matches = re.findall(img_pattern, content, re.IGNORECASE)
-            alt_matches = re.findall(alt_pattern, content, re.IGNORECASE)
+            # Find img tags without alt attributes in a single pass over the tags
+            img_count = alt_count = 0
+            for tag in _IMG_TAG_RE.findall(content):
+                lowered = tag.lower()
+                img_count += "src=" in lowered
+                alt_count += "alt=" in lowered
 
-            if len(img_matches) > len(alt_matches):
+            if img_count > alt_count:
                 images_without_alt.append(str(html_file))
         except Exception:
             continue
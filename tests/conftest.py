@@ -9,6 +9,7 @@ import gc
 import os
 from pathlib import Path
 import tempfile
+import tomllib
 from unittest.mock import patch
 
 import numpy as np
@@ -64,6 +65,38 @@ def clean_cache():
     gc.collect()
 
 
+@pytest.fixture(scope="session")
+def project_root():
+    """Provide the repository root directory."""
+    return Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session")
+def makefile_content(project_root):
+    """Provide the Makefile text, read once per session (None if absent)."""
+    makefile = project_root / "Makefile"
+    return makefile.read_text() if makefile.exists() else None
+
+
+@pytest.fixture(scope="session")
+def claude_md_content(project_root):
+    """Provide the CLAUDE.md text, read once per session (None if absent)."""
+    claude_md = project_root / "CLAUDE.md"
+    return claude_md.read_text() if claude_md.exists() else None
+
+
+@pytest.fixture(scope="session")
+def pyproject_content(project_root):
+    """Provide the pyproject.toml text, read once per session."""
+    return (project_root / "pyproject.toml").read_text()
+
+
+@pytest.fixture(scope="session")
+def pyproject_data(pyproject_content):
+    """Provide pyproject.toml parsed into a dict, parsed once per session."""
+    return tomllib.loads(pyproject_content)
+
+
 @pytest.fixture
 def test_materials():
     """Provide standard test materials with their densities."""
@@ -137,9 +170,9 @@ def temp_directory():
         yield Path(temp_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_calculation_result():
-    """Provide a sample calculation result for testing."""
+    """Provide a sample SiO2 calculation result, computed once per session."""
     return xlt.calculate_single_material_properties("SiO2", 10.0, 2.2)
 
 
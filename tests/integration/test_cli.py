@@ -7,7 +7,9 @@ ensuring the command line interface works correctly with various inputs and
 edge cases.
 """
 
+from contextlib import redirect_stdout
 import csv
+import io
 import json
 from pathlib import Path
 import tempfile
@@ -33,6 +35,19 @@ from xraylabtool.interfaces.cli import (
 )
 
 
+@pytest.fixture(scope="module")
+def main_help_output():
+    """Run ``xraylabtool --help`` once and return its exit code and text."""
+    buf = io.StringIO()
+    with (
+        patch("sys.argv", ["xraylabtool", "--help"]),
+        redirect_stdout(buf),
+        pytest.raises(SystemExit) as excinfo,
+    ):
+        main()
+    return excinfo.value.code, buf.getvalue()
+
+
 class TestEnergyParsing:
     """Test energy string parsing functionality."""
 
@@ -484,13 +499,11 @@ class TestMainFunction:
             result = main()
             assert result == 1  # Should show help and return error
 
-    def test_main_with_help(self):
+    def test_main_with_help(self, main_help_output):
         """Test main function with help argument."""
-        with patch("sys.argv", ["xraylabtool", "--help"]):
-            with pytest.raises(SystemExit) as excinfo:
-                main()
-            # argparse exits with 0 for --help
-            assert excinfo.value.code == 0
+        code, _ = main_help_output
+        # argparse exits with 0 for --help
+        assert code == 0
 
     def test_main_with_version(self):
         """Test main function with version argument."""
@@ -781,17 +794,13 @@ class TestInstallCompletionCommand:
         except ImportError:
             pytest.skip("completion_installer module not available")
 
-    @patch("subprocess.run")
-    @patch("pathlib.Path.exists")
-    def test_completion_installer_methods(self, mock_exists, mock_subprocess):
-        """Test CompletionInstaller methods with mocked dependencies."""
+    def test_completion_installer_methods(self):
+        """Test CompletionInstaller methods."""
         try:
             from xraylabtool.interfaces.completion import CompletionInstaller
 
-            # Mock that bash completion directories exist
-            mock_exists.return_value = True
-            mock_subprocess.return_value.returncode = 0
-
+            # Nothing here runs subprocesses or consults Path.exists, so no
+            # process-wide patches are needed
             installer = CompletionInstaller()
 
             # Test that methods exist and are callable
@@ -853,23 +862,11 @@ class TestInstallCompletionCommand:
         except ImportError:
             pytest.skip("completion_installer module not available")
 
-    def test_main_function_includes_install_completion(self):
+    def test_main_function_includes_install_completion(self, main_help_output):
         """Test that main function includes install-completion in command handlers."""
         # Test that install-completion is in the main help
-        with (
-            patch("sys.argv", ["xraylabtool", "--help"]),
-            patch("sys.stdout") as mock_stdout,
-        ):
-            from contextlib import suppress
-
-            with suppress(SystemExit):
-                main()
-
-            # Check if install-completion appears in help output
-            help_calls = [str(call) for call in mock_stdout.write.call_args_list]
-            help_text = "".join(help_calls)
-            if help_text:  # Only check if we got help output
-                assert "install-completion" in help_text
+        _, help_text = main_help_output
+        assert "install-completion" in help_text
 
     def test_install_completion_in_examples(self):
         """Test that install-completion appears in list examples."""
@@ -6,7 +6,7 @@ including virtual environment type detection and info gathering.
 
 from pathlib import Path
 import sys
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -174,20 +174,22 @@ class TestEnvironmentDetection:
         # Should be valid marker names
         assert all(isinstance(m, str) for m in conda_markers)
 
-    @patch.dict("os.environ", {"VIRTUAL_ENV": "/path/to/venv"})
-    def test_virtual_env_detection(self):
+    def test_virtual_env_detection(self, monkeypatch):
         """Test detection of virtual environment via env var."""
         # When VIRTUAL_ENV is set, should detect virtual environment
         import os
 
+        monkeypatch.setenv("VIRTUAL_ENV", "/path/to/venv")
+
         assert "VIRTUAL_ENV" in os.environ
         assert os.environ["VIRTUAL_ENV"] == "/path/to/venv"
 
-    @patch.dict("os.environ", {"CONDA_PREFIX": "/path/to/conda"})
-    def test_conda_env_detection(self):
+    def test_conda_env_detection(self, monkeypatch):
         """Test detection of conda environment via env var."""
         import os
 
+        monkeypatch.setenv("CONDA_PREFIX", "/path/to/conda")
+
         assert "CONDA_PREFIX" in os.environ
         assert os.environ["CONDA_PREFIX"] == "/path/to/conda"
 
@@ -13,17 +13,26 @@ from pathlib import Path
 import tempfile
 import unittest
 
-from xraylabtool.calculators.core import calculate_single_material_properties
+from xraylabtool.calculators.core import (
+    XRayResult,
+    calculate_single_material_properties,
+)
 from xraylabtool.io import export_to_csv, export_to_json
 
 
 class TestBasicExportFunctionality(unittest.TestCase):
     """Test basic export functionality."""
 
-    def setUp(self):
+    result: XRayResult
+
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures."""
-        # Create sample results for testing
-        self.result = calculate_single_material_properties("SiO2", 10.0, 2.2)
+        # Create sample results once; the export functions only read them
+        cls.result = calculate_single_material_properties("SiO2", 10.0, 2.2)
+
+    def setUp(self):
+        """Give each test its own results list around the shared result."""
         self.results = [self.result]
 
     def test_export_to_csv_basic(self):
@@ -77,8 +86,8 @@ class TestBasicExportFunctionality(unittest.TestCase):
 
     def test_export_to_json_multiple_results(self):
         """Test JSON export with multiple results."""
-        # Create multiple results
-        result1 = calculate_single_material_properties("SiO2", 10.0, 2.2)
+        # Create multiple results, reusing the shared SiO2 result
+        result1 = self.result
         result2 = calculate_single_material_properties("Al2O3", 10.0, 3.9)
         results = [result1, result2]
 